@@ -1,9 +1,13 @@
 ### IMPORTS
 
 from dataclasses import dataclass
-from enum import Enum, auto
-from typing import Any, Iterable, Iterator
+from typing import Any, Callable, Iterator, NamedTuple
 import json
+import mmap
+import os
+import re
+import stat
+import sys
 
 ### CONFIG
 
@@ -16,49 +20,95 @@ MAX_CAPACITY: int = 65355
 
 ### HELPFUL
 
-def clamp(value: Any, value_min: Any, value_max: Any) -> Any:
-    return min(max(value, value_min), value_max)
-
 type _SuppTypes = int | float | str | bool | list[int | float | str | bool] | dict[str, Any]
 
-### TOKENS
+### PATTERNS
 
-class TokenType(Enum):
-    Ident = auto()
-    NumberLit = auto()
-    StringLit = auto()
-    BoolLit = auto()
-    
-    Comma = auto()
-    Colon = auto()
-    LBrace = auto()
-    RBrace = auto()
-    LBracket = auto()
-    RBracket = auto()
+_WS = re.compile(r'[ \t\n\r\f\v]+')
+_NUM = re.compile(r'\.[0-9]+|[0-9]+(?:\.[0-9]*)?')
+_IDENT = re.compile(r'[A-Za-z0-9]+')
+_HEX4 = re.compile(r'[0-9A-Fa-f]{4}')
 
-@dataclass
-class Position:
+# Character classes, only ASCII characters belong to any of them
+_C_SPACE: int = 1
+_C_DIGIT: int = 2
+_C_ALPHA: int = 4
+
+_CLASS: dict[str, int] = {}
+
+for _chars, _class in ((' \t\n\r\f\v', _C_SPACE), ('0123456789', _C_DIGIT), ('abcdefghijklmnopqrstuvwxyzABCDEFGHIJKLMNOPQRSTUVWXYZ', _C_ALPHA)):
+    for _char in _chars:
+        _CLASS[_char] = _CLASS.get(_char, 0) | _class
+
+del _chars, _class, _char
+
+# Escape sequences of string literals without the leading backslash, \uXXXX is handled separately
+_ESC: dict[str, str] = {
+    '\\': '\\',
+    '"': '"',
+    '/': '/',
+    'n': '\n',
+    't': '\t',
+    'b': '\b',
+    'f': '\f',
+    'r': '\r',
+}
+
+### TOKENS
+
+# Plain ints instead of Enum members, they are compared and hashed for every token
+class TokenType:
+    Ident = 0
+    NumberLit = 1
+    StringLit = 2
+    BoolLit = 3
+    
+    Comma = 4
+    Colon = 5
+    LBrace = 6
+    RBrace = 7
+    LBracket = 8
+    RBracket = 9
+
+_TOKEN_NAMES: dict[int, str] = {value: name for name, value in vars(TokenType).items() if not name.startswith('_')}
+
+_PUNCT: dict[str, int] = {
+    ':': TokenType.Colon,
+    ',': TokenType.Comma,
+    '[': TokenType.LBracket,
+    ']': TokenType.RBracket,
+    '{': TokenType.LBrace,
+    '}': TokenType.RBrace,
+}
+
+class Position(NamedTuple):
     line: int
     col: int
     
     def __str__(self) -> str: return f"({self.line}, {self.col})"
     __repr__ = __str__
 
-@dataclass
-class RangePos:
+class RangePos(NamedTuple):
     start_pos: Position
     end_pos: Position
     
     def __str__(self) -> str: return f"({self.start_pos} -> {self.end_pos})"
     __repr__ = __str__
 
-@dataclass
-class Token:
-    type: TokenType
-    pos: RangePos
+# Flat tuple, so the scanner doesn't allocate Position and RangePos objects for every token
+class Token(NamedTuple):
+    type: int
+    start_line: int
+    start_col: int
+    end_line: int
+    end_col: int
     value: Any | None = None
     
-    def __str__(self) -> str: return f"Token({self.type}, {self.pos})" if self.value is None else f"Token({self.type}, {self.pos}, {repr(self.value)})"
+    @property
+    def pos(self) -> RangePos:
+        return RangePos(Position(self.start_line, self.start_col), Position(self.end_line, self.end_col))
+    
+    def __str__(self) -> str: return f"Token({_TOKEN_NAMES[self.type]}, {self.pos})" if self.value is None else f"Token({_TOKEN_NAMES[self.type]}, {self.pos}, {repr(self.value)})"
     __repr__ = __str__
 
 ### ERRORS
@@ -73,201 +123,187 @@ class JsonError(Exception): ...
 
 class Scanner:
     def __init__(self, source: str) -> None:
-        self.source = iter(source)
         self.source_lit = source
+        self._n = len(source)
         self.index = -1
         self.line = 1
-        self.col = 0
-                
+        self._line_start = 0
+        self.cur_char: str | None = None
+        
         self.advance()
-        self.cur_pos = Position(self.line, self.col)
+    
+    @property
+    def cur_pos(self) -> Position:
+        return Position(self.line, self.index - self._line_start)
     
     def advance(self) -> None:
-        try:
-            self.cur_char = next(self.source)
-            self.index += 1
-            self.cur_pos = Position(self.line, self.col)
-            
-            if self.cur_char == '\n':
-                self.line += 1
-                self.col = 1
-            
-            else:
-                self.col += 1
+        if self.cur_char == '\n':
+            self.line += 1
+            self._line_start = self.index
         
-        except StopIteration:
-            self.cur_pos = Position(self.line, self.col)
-            
-            if self.cur_char is not None:
-                self.col += 1
-            
-            self.cur_char = None
+        self.index += 1
+        self.cur_char = self.source_lit[self.index] if self.index < self._n else None
+    
+    def _jump_to(self, index: int) -> None:
+        lines: int = self.source_lit.count('\n', self.index, index)
+        
+        if lines:
+            self.line += lines
+            self._line_start = self.source_lit.rfind('\n', self.index, index)
+        
+        self.index = index
+        self.cur_char = self.source_lit[index] if index < self._n else None
     
     def peek(self, offset: int = 0) -> str:
-        return self.source_lit[clamp(self.index + offset, 0, len(self.source_lit))]
+        index: int = self.index + offset
+        return self.source_lit[index] if 0 <= index < self._n else ''
     
     def eat(self) -> str:
-        prev: str = self.peek()
+        prev: str = self.cur_char # type: ignore
         self.advance()
         return prev
     
-    def expect(self, char: str | Iterable[str]) -> None:
-        if not isinstance(char, str) and not isinstance(char, Iterable):
-            raise TypeError("Expected 'str' or 'Iterable[str]' type")
-        
-        # single character
-        if isinstance(char, str) and len(char) == 1:
-            if self.cur_char != char:
-                raise ScannerError(f'Expected \'{char}\'')
-            
-            self.advance()
+    def expect_char(self, char: str) -> None:
+        if self.cur_char != char:
+            raise ScannerError(f'Expected \'{char}\'')
         
-        # multiple characters
-        elif isinstance(char, Iterable) or len(char) > 1:
-            if self.cur_char is not None and self.cur_char not in char:
-                raise ScannerError(f"Expected {' | '.join(char)}")
-            
-            self.advance()
+        self.advance()
     
-    def eat_expect(self, char: str | Iterable[str]) -> str:
-        prev: str = self.peek()
-        self.expect(char)
+    def eat_expect(self, char: str) -> str:
+        prev: str = self.cur_char # type: ignore
+        self.expect_char(char)
         return prev
     
     def tokenize(self) -> list[Token]:
         tokens: list[Token] = []
         
         while self.cur_char is not None:
-            if not LINE_COMMENTS and self.cur_char == '/' and self.peek(1) == '/':
-                raise ScannerError(f"Unexpected comment at {self.cur_pos}")
+            char_class: int = _CLASS.get(self.cur_char, 0)
             
-            elif LINE_COMMENTS and self.cur_char == '/' and self.peek(1) == '/':
-                while self.cur_char is not None and self.cur_char != '\n':
-                    self.advance()
-                
-                self.advance()
-                self.line += 1
-                self.col = 1
+            if char_class & _C_SPACE:
+                self._jump_to(_WS.match(self.source_lit, self.index).end()) # type: ignore
             
-            elif self.cur_char.isspace():
-                while self.cur_char is not None and self.cur_char.isspace():
-                    self.advance()
-            
-            elif self.cur_char.isdigit() or (self.cur_char == '.' and self.peek(1).isdigit()):
-                start_pos: Position = self.cur_pos
-                number: str = ''
-                points: int = 0
+            elif char_class & _C_DIGIT or (self.cur_char == '.' and _CLASS.get(self.peek(1), 0) & _C_DIGIT):
+                start_col: int = self.index - self._line_start
+                end: int = _NUM.match(self.source_lit, self.index).end() # type: ignore
+                number: str = self.source_lit[self.index:end]
                 
-                if self.cur_char == '.' and self.peek(1).isdigit():
-                    points += 1
-                    number += self.eat()
+                # Numbers never span lines, so there are no newlines for _jump_to to count
+                self.index = end
+                self.cur_char = self.source_lit[end] if end < self._n else None
                 
-                while self.cur_char is not None and (self.cur_char.isdigit() or self.cur_char == '.'):
-                    if points > 1:
-                        raise ScannerError(f'Invalid amount of points in float number at {self.cur_pos}')
-                    
-                    number += self.eat()
+                if self.cur_char == '.':
+                    raise ScannerError(f'Invalid amount of points in float number at {self.cur_pos}')
                 
-                    if self.cur_char == '.':
-                        points += 1
-                        number += self.eat()
-                
-                tokens.append(Token(TokenType.NumberLit, RangePos(start_pos, self.cur_pos), int(number) if points == 0 else float(number)))
+                tokens.append(Token(TokenType.NumberLit, self.line, start_col, self.line, end - self._line_start, int(number) if '.' not in number else float(number)))
             
             elif self.cur_char == '"':
-                start_pos: Position = self.cur_pos
-                self.advance()
-                string: str = ''
+                start_col: int = self.index - self._line_start
+                start: int = self.index + 1
+                quote: int = self.source_lit.find('"', start)
                 
-                while self.cur_char is not None and self.cur_char != '"':
-                    if self.cur_char == '\\':
+                # Most strings have no escapes, those are sliced out of the source as they are
+                if quote != -1 and self.source_lit.find('\\', start, quote) == -1 and self.source_lit.find('\n', start, quote) == -1:
+                    string: str = self.source_lit[start:quote]
+                    self._jump_to(quote + 1)
+                
+                else:
+                    self.advance()
+                    parts: list[str] = []
+                    
+                    while True:
+                        if quote < self.index:
+                            quote = self.source_lit.find('"', self.index)
+                            
+                            # Unterminated string, escapes are still read up to the end so a trailing backslash is reported as such
+                            if quote == -1:
+                                quote = self._n
+                        
+                        backslash: int = self.source_lit.find('\\', self.index, quote)
+                        end: int = quote if backslash == -1 else backslash
+                        
+                        if self.source_lit.find('\n', self.index, end) != -1:
+                            raise ScannerError(f"Expected \"")
+                        
+                        if backslash == -1 and quote == self._n:
+                            raise ScannerError(f"Expected \"")
+                        
+                        parts.append(self.source_lit[self.index:end])
+                        self.index = end
+                        self.cur_char = self.source_lit[end]
+                        
+                        if backslash == -1:
+                            break
+                        
                         self.advance()
-                        is_unicode: bool = False
                         
-                        match self.cur_char:
-                            case '\\': string += '\\'
-                            case 'n': string += '\n'
-                            case 't': string += '\t'
-                            case 'b': string += '\b'
-                            case 'f': string += '\f'
-                            case 'r': string += '\r'
-                            case 'u':
-                                is_unicode = True
-                                symbol_addr: str = '0x'
-                                digits: list[str] = list('0123456789abcdefABCDEF')
-                                self.advance()
-                                
-                                while self.cur_char != None and self.cur_char in digits:
-                                    symbol_addr += self.eat_expect(digits)
-                                    
-                                    if len(symbol_addr) != 6 and self.peek() not in digits:
-                                        raise ScannerError(f"Unexpected character at {Position(self.line, self.col + 1)}")
-                                
-                                if len(symbol_addr) > 6:
-                                    raise ScannerError(f'Expected exact 4 hexadecimal digits, but got {len(symbol_addr) - 2} at {self.cur_pos}')
-                                
-                                string += chr(int(symbol_addr, 16))
-                            case None: raise ScannerError(f"Expected escape character at {self.cur_pos}")
-                            case _: raise ScannerError(f"Unexpected escape character '\\{self.cur_char}' at {self.cur_pos}")
+                        replacement: str | None = _ESC.get(self.cur_char) # type: ignore
                         
-                        if not is_unicode:
+                        if replacement is not None:
+                            parts.append(replacement)
                             self.advance()
+                        
+                        elif self.cur_char == 'u':
+                            digits: re.Match[str] | None = _HEX4.match(self.source_lit, self.index + 1)
+                            
+                            if digits is None:
+                                raise ScannerError(f'Expected exact 4 hexadecimal digits at {self.cur_pos}')
+                            
+                            code: int = int(digits.group(), 16)
+                            self.index += 5
+                            
+                            # High surrogate followed by a low one, together they encode a single character
+                            if 0xD800 <= code <= 0xDBFF and self.source_lit.startswith('\\u', self.index):
+                                low_digits: re.Match[str] | None = _HEX4.match(self.source_lit, self.index + 2)
+                                low: int = int(low_digits.group(), 16) if low_digits is not None else 0
+                                
+                                if 0xDC00 <= low <= 0xDFFF:
+                                    code = 0x10000 + ((code - 0xD800) << 10) + (low - 0xDC00)
+                                    self.index += 6
+                            
+                            self.cur_char = self.source_lit[self.index] if self.index < self._n else None
+                            parts.append(chr(code))
+                        
+                        elif self.cur_char is None:
+                            raise ScannerError(f"Expected escape character at {self.cur_pos}")
+                        
+                        else:
+                            raise ScannerError(f"Unexpected escape character '\\{self.cur_char}' at {self.cur_pos}")
                     
-                    string += self.eat()
-                    
-                    if self.cur_char is None or self.cur_char == '\n':
-                        raise ScannerError(f"Expected \"")
+                    self.advance()
+                    string: str = ''.join(parts)
                 
-                self.advance()
-                tokens.append(Token(TokenType.StringLit, RangePos(start_pos, self.cur_pos), string))
+                tokens.append(Token(TokenType.StringLit, self.line, start_col, self.line, self.index - self._line_start, string))
             
-            elif self.cur_char.isalnum():
-                start_pos: Position = self.cur_pos
-                ident: str = ''
-                
-                while self.cur_char is not None and self.cur_char.isalnum():
-                    ident += self.eat()
+            elif char_class & _C_ALPHA:
+                start_col: int = self.index - self._line_start
+                ident: str = _IDENT.match(self.source_lit, self.index).group() # type: ignore
+                self._jump_to(self.index + len(ident))
                 
                 if ident in ('false', 'true'):
-                    tokens.append(Token(TokenType.BoolLit, RangePos(start_pos, self.cur_pos), False if ident == 'false' else True))
+                    tokens.append(Token(TokenType.BoolLit, self.line, start_col, self.line, self.index - self._line_start, False if ident == 'false' else True))
                 
                 else:
-                    raise ScannerError(f"Expected 'false' or 'true', but got '{ident}' at {start_pos}")
+                    raise ScannerError(f"Expected 'false' or 'true', but got '{ident}' at {Position(self.line, start_col)}")
+            
+            elif self.cur_char == '/' and self.peek(1) == '/':
+                if not LINE_COMMENTS:
+                    raise ScannerError(f"Unexpected comment at {self.cur_pos}")
+                
+                while self.cur_char is not None and self.cur_char != '\n':
+                    self.advance()
+                
+                self.advance()
             
             else:
-                match self.cur_char:
-                    case ':':
-                        start_pos: Position = self.cur_pos
-                        self.advance()
-                        tokens.append(Token(TokenType.Colon, RangePos(start_pos, self.cur_pos), ':'))
-                    
-                    case ',':
-                        start_pos: Position = self.cur_pos
-                        self.advance()
-                        tokens.append(Token(TokenType.Comma, RangePos(start_pos, self.cur_pos), ','))
-                    
-                    case '[':
-                        start_pos: Position = self.cur_pos
-                        self.advance()
-                        tokens.append(Token(TokenType.LBracket, RangePos(start_pos, self.cur_pos), '['))
-                    
-                    case ']':
-                        start_pos: Position = self.cur_pos
-                        self.advance()
-                        tokens.append(Token(TokenType.RBracket, RangePos(start_pos, self.cur_pos), ']'))
-                    
-                    case '{':
-                        start_pos: Position = self.cur_pos
-                        self.advance()
-                        tokens.append(Token(TokenType.LBrace, RangePos(start_pos, self.cur_pos), '{'))
-                    
-                    case '}':
-                        start_pos: Position = self.cur_pos
-                        self.advance()
-                        tokens.append(Token(TokenType.RBrace, RangePos(start_pos, self.cur_pos), '}'))
-                    
-                    case _:
-                        raise ScannerError(f"Unexpected character '{self.cur_char}' at {self.cur_pos}")
+                tok_type: int | None = _PUNCT.get(self.cur_char)
+                
+                if tok_type is None:
+                    raise ScannerError(f"Unexpected character '{self.cur_char}' at {self.cur_pos}")
+                
+                start_col: int = self.index - self._line_start
+                tokens.append(Token(tok_type, self.line, start_col, self.line, start_col + 1, self.cur_char))
+                self.advance()
         
         return tokens
 
@@ -282,40 +318,37 @@ class NodeBase: ...
 class JsonBlock(NodeBase):
     nodes: list['Node']
     
-    def __find_key(self, key: str) -> int:
-        index: int = 0
+    def __post_init__(self) -> None:
+        self._index: dict[str, int] | None = None
+        self._index_len: int = 0
+    
+    def __build_index(self) -> dict[str, int]:
+        index: dict[str, int] = {}
         
-        for node in self.nodes:
-            if node.key.value == key: # type: ignore
-                return index
-            
-            index += 1
+        # setdefault keeps the first node of a repeated key, same as a linear search would
+        for i, node in enumerate(self.nodes):
+            index.setdefault(node.key.value, i) # type: ignore
         
-        raise JsonError(f'Unable to find key "{key}"')
+        self._index = index
+        self._index_len = len(self.nodes)
+        return index
     
-    def __convert_list_to_arr(self, values: list) -> NodeBase:
-        result: list[NodeBase] = []
+    def __find_key(self, key: str) -> int:
+        # nodes is public and may be edited directly, so a hit is checked against it before being trusted
+        index: dict[str, int] | None = self._index
         
-        for value in values:
-            if isinstance(value, (int, float)):
-                result.append(NumberNode(value))
-            
-            elif isinstance(value, str):
-                result.append(StringNode(value))
-            
-            elif isinstance(value, bool):
-                result.append(BooleanNode(value))
-            
-            elif isinstance(value, dict):
-                result.append(Parser(Scanner(json.dumps(value)).tokenize()).parse())
-            
-            elif isinstance(value, list):
-                result.append(self.__convert_list_to_arr(value))
+        if index is None or self._index_len != len(self.nodes):
+            index = self.__build_index()
+        
+        i: int | None = index.get(key)
+        
+        if i is None or self.nodes[i].key.value != key: # type: ignore
+            i = self.__build_index().get(key)
             
-            else:
-                raise TypeError(f"Unexpected type of value '{type(value).__name__}'")
+            if i is None:
+                raise JsonError(f'Unable to find key "{key}"')
         
-        return ArrayNode(result)
+        return i
     
     def items[K, V](self) -> JsonItems[K, V]:
         return [(n.key.value, n.value.value if not isinstance(n.value, JsonBlock) else n.value) for n in self.nodes] # type: ignore
@@ -339,31 +372,13 @@ class JsonBlock(NodeBase):
         return self.nodes[self.__find_key(key)].value # type: ignore
     
     def __setitem__(self, key: str, value: _SuppTypes) -> None:
-        key_index = self.__find_key(key)
-        
-        if isinstance(value, (int, float)):
-            self.nodes[key_index] = Node(StringNode(key), NumberNode(value))
-        
-        elif isinstance(value, str):
-            self.nodes[key_index] = Node(StringNode(key), StringNode(value))
-        
-        elif isinstance(value, bool):
-            self.nodes[key_index] = Node(StringNode(key), BooleanNode(value))
-        
-        elif isinstance(value, list):
-            self.nodes[key_index] = Node(StringNode(key), self.__convert_list_to_arr(value))
-        
-        elif isinstance(value, dict):
-            self.nodes[key_index] = Node(StringNode(key), Parser(Scanner(json.dumps(value)).tokenize()).parse())
-        
-        else:
-            raise TypeError(f"Unexpected type of value '{type(value).__name__}'")
+        self.nodes[self.__find_key(key)] = Node(StringNode(key), py_to_node(value))
     
     def get_keys(self) -> list[str]:
         return [node.key.value for node in self.nodes] # type: ignore
     
     def get_values(self) -> list[NodeBase]:
-        return [node.value.value for node in self.nodes] # type: ignore
+        return [n.value.value if not isinstance(n.value, JsonBlock) else n.value for n in self.nodes] # type: ignore
 
 # LITERAL ':' LITERAL ','?
 @dataclass
@@ -407,7 +422,7 @@ class NumberNode(NodeBase):
 class BooleanNode(NodeBase):
     value: bool
     
-    def __str__(self) -> str: return 'false' if self.value else 'true'
+    def __str__(self) -> str: return 'true' if self.value else 'false'
     __repr__ = __str__
     
     def __bool__(self) -> bool:
@@ -432,8 +447,6 @@ class ArrayNode(NodeBase):
 class Parser:
     def __init__(self, tokens: list[Token]) -> None:
         self.tokens = iter(tokens)
-        self.tokens_lit = tokens
-        self.index = -1
         self.fields_count = 0
         
         self.advance()
@@ -441,24 +454,20 @@ class Parser:
     def advance(self) -> None:
         try:
             self.cur_token = next(self.tokens)
-            self.index += 1
         
         except StopIteration:
             self.cur_token = None
     
-    def peek(self, offset: int = 0) -> Token:
-        return self.tokens_lit[clamp(self.index + offset, 0, len(self.tokens_lit))]
-    
-    def expect(self, tok_type: TokenType, explanation: str = '', do_advance: bool = True) -> None:
-        if self.cur_token == None or self.cur_token.type != tok_type:
+    def expect(self, tok_type: int, explanation: str = '', do_advance: bool = True) -> None:
+        if self.cur_token is None or self.cur_token.type != tok_type:
             raise ParserError(f"Expected '{explanation}', but got '{type(self.cur_token.value).__name__}' at {self.cur_token.pos}" if self.cur_token is not None else
                               f"Expected '{explanation}'")
         
         if do_advance:
             self.advance()
     
-    def eat_expect(self, tok_type: TokenType, explanation: str = '') -> Token:
-        prev = self.peek()
+    def eat_expect(self, tok_type: int, explanation: str = '') -> Token:
+        prev: Token = self.cur_token # type: ignore
         self.expect(tok_type, explanation)
         return prev
     
@@ -477,17 +486,18 @@ class Parser:
     
     def parse_fields(self) -> list[Node]:
         fields: list[Node] = []
-        keys: list[str] = []
+        seen: set[str] = set()
         
         while self.cur_token is not None and self.cur_token.type != TokenType.RBrace:
-            field, pos = self.parse_field()
+            field, key_token = self.parse_field()
             self.fields_count += 1
             
-            keys.append(field.key.value) # type: ignore
+            key: str = field.key.value # type: ignore
             
-            if len(keys) != len(set(keys)):
-                raise ParserError(f"Duplicated key found at {pos.start_pos}")
+            if key in seen:
+                raise ParserError(f"Duplicated key found at {key_token.pos.start_pos}")
             
+            seen.add(key)
             fields.append(field)
             
             if self.fields_count > MAX_CAPACITY:
@@ -504,16 +514,19 @@ class Parser:
         
         return fields
     
-    def parse_field(self) -> tuple[Node, RangePos]:
+    def parse_field(self) -> tuple[Node, Token]:
         self.expect(TokenType.StringLit, 'str', do_advance = False)
-        key_location: RangePos = self.cur_token.pos # type: ignore
-        key: NodeBase = self.parse_primary()
+        key_token: Token = self.cur_token # type: ignore
+        self.advance()
+        
+        # Same keys repeat across objects of an array, interning them keeps one copy of each
+        key: NodeBase = StringNode(sys.intern(key_token.value)) # type: ignore
         
         self.expect(TokenType.Colon, ':')
         
         value: NodeBase = self.parse_primary()
         
-        return Node(key, value), key_location
+        return Node(key, value), key_token
     
     def parse_primary(self) -> NodeBase:
         tok = self.cur_token
@@ -521,34 +534,36 @@ class Parser:
         if tok is None:
             raise ParserError(f"Expected token")
         
-        match tok.type:
-            # Found number literal
-            case TokenType.NumberLit:
-                self.advance()
-                return NumberNode(tok.value) # type: ignore
-            
-            # Found string literal
-            case TokenType.StringLit:
-                self.advance()
-                return StringNode(tok.value) # type: ignore
-            
-            case TokenType.BoolLit:
-                self.advance()
-                return BooleanNode(tok.value) # type: ignore
-            
-            case TokenType.LBracket:
-                self.advance()
-                arr_values: list[NodeBase] = self.parse_arr_values()
-                self.expect(TokenType.RBracket, ']')
-                
-                return ArrayNode(arr_values)
-            
-            # Found another object
-            case TokenType.LBrace:
-                return self.parse()
-            
-            case _:
-                raise ParserError(f"Unexpected token '{tok.value}' at {tok.pos}")
+        parse_func = Parser.PRIMARY_PARSERS.get(tok.type)
+        
+        if parse_func is None:
+            raise ParserError(f"Unexpected token '{tok.value}' at {tok.pos}")
+        
+        return parse_func(self)
+    
+    # Found number literal
+    def parse_number_lit(self) -> NodeBase:
+        value = self.cur_token.value # type: ignore
+        self.advance()
+        return NumberNode(value) # type: ignore
+    
+    # Found string literal
+    def parse_string_lit(self) -> NodeBase:
+        value = self.cur_token.value # type: ignore
+        self.advance()
+        return StringNode(value) # type: ignore
+    
+    def parse_bool_lit(self) -> NodeBase:
+        value = self.cur_token.value # type: ignore
+        self.advance()
+        return BooleanNode(value) # type: ignore
+    
+    def parse_array(self) -> NodeBase:
+        self.advance()
+        arr_values: list[NodeBase] = self.parse_arr_values()
+        self.expect(TokenType.RBracket, ']')
+        
+        return ArrayNode(arr_values)
     
     def parse_arr_values(self) -> list[NodeBase]:
         fields: list[NodeBase] = []
@@ -563,16 +578,73 @@ class Parser:
                     raise ParserError(f"Unexpected trailing comma at {self.cur_token.pos}")
         
         return fields
+    
+    # Parsing functions of tokens that can start a value, an object is parsed by parse itself
+    PRIMARY_PARSERS: dict[int, Callable[['Parser'], NodeBase]] = {
+        TokenType.NumberLit: parse_number_lit,
+        TokenType.StringLit: parse_string_lit,
+        TokenType.BoolLit: parse_bool_lit,
+        TokenType.LBracket: parse_array,
+        TokenType.LBrace: parse,
+    }
 
 def parse(file_path: str) -> JsonBlock:
     """Parses source and outputs parsed json"""
-    with open(file_path) as f: source = f.read()
+    with open(file_path, 'rb') as f:
+        st: os.stat_result = os.fstat(f.fileno())
+        
+        # Decoding straight from the mapped file skips the bytes copy made by read(),
+        # pipes and other non-regular files report no size and, like empty files, can't be mapped
+        if stat.S_ISREG(st.st_mode) and st.st_size > 0:
+            with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+                source: str = str(mm, 'utf-8')
+        
+        else:
+            source: str = f.read().decode('utf-8')
+    
     return Parser(Scanner(source).tokenize()).parse()
 
 def parse_string(source: str) -> JsonBlock:
     """Parses source string into json"""
     return Parser(Scanner(source).tokenize()).parse()
 
+def to_py(node: NodeBase) -> _SuppTypes:
+    """Converts parsed node into python object"""
+    if isinstance(node, JsonBlock):
+        return {n.key.value: to_py(n.value) for n in node.nodes} # type: ignore
+    
+    if isinstance(node, ArrayNode):
+        return [to_py(value) for value in node.value] # type: ignore
+    
+    return node.value # type: ignore
+
+def py_to_node(value: _SuppTypes) -> NodeBase:
+    """Converts python object into node"""
+    if isinstance(value, bool):
+        return BooleanNode(value)
+    
+    if isinstance(value, (int, float)):
+        return NumberNode(value)
+    
+    if isinstance(value, str):
+        return StringNode(value)
+    
+    if isinstance(value, list):
+        return ArrayNode([py_to_node(item) for item in value])
+    
+    if isinstance(value, dict):
+        nodes: list[Node] = []
+        
+        for key, item in value.items():
+            if not isinstance(key, str):
+                raise TypeError(f"Unexpected type of key '{type(key).__name__}'")
+            
+            nodes.append(Node(StringNode(key), py_to_node(item)))
+        
+        return JsonBlock(nodes)
+    
+    raise TypeError(f"Unexpected type of value '{type(value).__name__}'")
+
 def dump(tree: JsonBlock, /, indent: int = 4) -> str:
     """Converts parsed json into string"""
-    return json.dumps(json.loads(str(tree)), indent=indent)
+    return json.dumps(to_py(tree), indent=indent)